@@ -1,6 +1,56 @@
-from ..calculate import sum_numbers
+import pytest
+
+from ..calculate import sum_numbers, divide_numbers, sum_numbers_vec, multiply_numbers_vec, divide_numbers_vec
 
 def test_sum_numbers():
     assert sum_numbers(1, 2) == 3
     assert sum_numbers(-1, 1) == 0
     assert sum_numbers(0, 0) == 0
+
+def test_divide_numbers():
+    assert divide_numbers(6, 3) == 2
+    assert divide_numbers(1, 4) == 0.25
+    with pytest.raises(ValueError):
+        divide_numbers(1, 0)
+    with pytest.raises(ValueError):
+        divide_numbers(1.0, 0.0)
+
+def test_divide_numbers_numpy_scalar_by_zero():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        divide_numbers(np.float64(1), 0.0)
+    with pytest.raises(ValueError):
+        divide_numbers(1.0, np.float64(0))
+
+def test_vec_functions():
+    np = pytest.importorskip("numpy")
+    assert np.array_equal(sum_numbers_vec([1, 2], [3, 4]), [4, 6])
+    assert np.array_equal(multiply_numbers_vec([1, 2], [3, 4]), [3, 8])
+    assert np.array_equal(divide_numbers_vec([3.0, 8.0], [3.0, 4.0]), [1.0, 2.0])
+
+def test_vec_functions_out():
+    np = pytest.importorskip("numpy")
+    out = np.empty(2)
+    assert sum_numbers_vec([1.0, 2.0], [3.0, 4.0], out=out) is out
+    assert np.array_equal(out, [4.0, 6.0])
+
+def test_divide_numbers_vec_by_zero():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        divide_numbers_vec([1.0, 2.0], [1.0, 0.0])
+
+def test_fma():
+    np = pytest.importorskip("numpy")
+    from ..calculate_numba import fma
+    assert np.array_equal(fma([1.0, 2.0], [3.0, 4.0], [1.0, 1.0]), [4.0, 9.0])
+    with pytest.raises(ValueError):
+        fma([1.0, 2.0], [3.0], [1.0, 1.0])
+
+def test_fma_out():
+    np = pytest.importorskip("numpy")
+    from ..calculate_numba import fma
+    out = np.empty(2)
+    assert fma([1.0, 2.0], [3.0, 4.0], [1.0, 1.0], out=out) is out
+    assert np.array_equal(out, [4.0, 9.0])
+    with pytest.raises(ValueError):
+        fma([1.0, 2.0], [3.0, 4.0], [1.0, 1.0], out=np.empty(1))
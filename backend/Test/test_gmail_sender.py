@@ -0,0 +1,219 @@
+import itertools
+import socketserver
+import threading
+from email.mime.text import MIMEText
+
+import pytest
+
+from ..gmail_sender import GmailPool, GmailSender
+
+
+class FakeSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough of an SMTP server to record what the client sends."""
+
+    def handle(self):
+        state = self.server.state
+        reply = lambda text: self.wfile.write(text.encode() + b"\r\n")
+        if next(state["connections"]) in state["refuse_connections"]:
+            reply("554 busy")
+            return
+        reply("220 fake")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().rstrip("\r\n")
+            state["commands"].append(command)
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                *first, last = ["fake"] + state["extensions"]
+                for extension in first:
+                    reply(f"250-{extension}")
+                reply(f"250 {last}")
+            elif verb == "RCPT" and command[8:].strip("<>") in state["refuse"]:
+                reply("550 no such user")
+            elif verb == "DATA":
+                reply("354 go ahead")
+                body = b""
+                for data in iter(self.rfile.readline, b".\r\n"):
+                    body += data[1:] if data.startswith(b".") else data
+                self.accept(state, "DATA", body)
+            elif verb == "BDAT":
+                self.accept(state, "BDAT", self.rfile.read(int(command.split()[1])))
+            elif verb == "QUIT":
+                reply("221 bye")
+                return
+            else:
+                reply("250 ok")
+
+    def accept(self, state, verb, body):
+        # Scripted replies to the message body come first, then "250 queued"
+        text = state["body_replies"].pop(0) if state["body_replies"] else "250 queued"
+        if text.startswith("250"):
+            state["messages"].append((verb, body))
+        self.wfile.write(text.encode() + b"\r\n")
+
+
+class _NoAuthSMTP(GmailSender.SMTP_CLASS):
+    def starttls(self, *args, **kwargs):
+        self.ehlo()
+        return (220, b"")
+
+    def login(self, user, password):
+        return (235, b"")
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeSMTPHandler)
+    server.daemon_threads = True
+    server.state = {"commands": [], "messages": [], "refuse": set(),
+                    "extensions": ["PIPELINING", "CHUNKING", "SIZE 100000"],
+                    "body_replies": [], "connections": itertools.count(),
+                    "refuse_connections": set()}
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    monkeypatch.setattr(GmailSender, "SMTP_SERVER", "127.0.0.1")
+    monkeypatch.setattr(GmailSender, "SMTP_PORT", server.server_address[1])
+    monkeypatch.setattr(GmailSender, "SMTP_CLASS", _NoAuthSMTP)
+    yield server.state
+    server.shutdown()
+    server.server_close()
+
+
+def _mimetext(sender_email, recipient_email, subject, body, subtype="plain", cc=None):
+    """Render a message the way send_email() did before build_message() existed."""
+    message = MIMEText(body, subtype)
+    message["From"] = sender_email
+    message["To"] = recipient_email
+    message["Subject"] = subject
+    if cc:
+        message["Cc"] = ", ".join(cc)
+    return message.as_bytes(policy=message.policy.clone(linesep="\r\n"))
+
+
+def _envelope(state):
+    return [c for c in state["commands"] if c.upper().startswith(("MAIL", "RCPT"))]
+
+
+def test_pipelined_envelope(smtp):
+    assert GmailSender("me@x", "pw").send_email("a@x", "Hi", "body")
+    assert smtp["commands"][1].startswith("MAIL FROM:<me@x> size=")
+    assert _envelope(smtp)[1] == "RCPT TO:<a@x>"
+
+
+def test_serial_envelope(smtp):
+    smtp["extensions"] = ["SIZE 100000"]
+    assert GmailSender("me@x", "pw").send_email("a@x", "Hi", "body")
+    assert _envelope(smtp)[0].startswith("mail FROM:<me@x> size=")
+    assert _envelope(smtp)[1] == "rcpt TO:<a@x>"
+
+
+@pytest.mark.parametrize("extensions, verb", [(["CHUNKING"], "BDAT"), ([], "DATA")])
+def test_body_round_trips(smtp, extensions, verb):
+    smtp["extensions"] = extensions
+    sender = GmailSender("me@x", "pw")
+    message = b"Subject: Hi\r\n\r\n.leading dot\r\n..two\r\n.\r\nend\r\n"
+    assert sender.send_to_many(["a@x"], message)
+    ((sent_verb, body),) = smtp["messages"]
+    assert sent_verb == verb
+    assert body == message
+
+
+def test_partial_refusal_still_sends(smtp):
+    smtp["refuse"] = {"b@x"}
+    sender = GmailSender("me@x", "pw")
+    assert sender.send_to_many(["a@x", "b@x"], sender.build_message("Hi", "body"))
+    assert len(smtp["messages"]) == 1
+
+
+def test_total_refusal_resets(smtp):
+    smtp["refuse"] = {"a@x"}
+    assert not GmailSender("me@x", "pw").send_email("a@x", "Hi", "body")
+    assert smtp["messages"] == []
+    assert "RSET" in [c.upper() for c in smtp["commands"]]
+
+
+def test_newline_in_recipient_is_rejected(smtp):
+    assert not GmailSender("me@x", "pw").send_email("a@x\r\nBcc: evil@x", "Hi", "body")
+    assert smtp["messages"] == []
+
+
+@pytest.mark.parametrize("extensions", [["PIPELINING"], []])
+def test_newline_in_envelope_is_rejected(smtp, extensions):
+    smtp["extensions"] = extensions
+    assert not GmailSender("me@x", "pw").send_email("a@x", "Hi", "body", bcc=['"x\nDATA"@y'])
+    assert not any(c.upper() == "DATA" for c in smtp["commands"])
+    assert smtp["messages"] == []
+
+
+def test_non_ascii_recipient_matches_mimetext():
+    sender = GmailSender("me@x", "pw")
+    recipients, message = sender._address(sender.build_message("Hi", "body"), "José <j@x.com>")
+    assert recipients == ["José <j@x.com>"]
+    assert message == _mimetext("me@x", "José <j@x.com>", "Hi", "body")
+
+
+def test_non_ascii_recipient_is_sent(smtp):
+    assert GmailSender("me@x", "pw").send_email("José <j@x.com>", "Hi", "body")
+    assert _envelope(smtp)[1] == "RCPT TO:<j@x.com>"
+    assert b"\r\nTo: =?utf-8?b?Sm9zw6kgPGpAeC5jb20+?=\r\n" in smtp["messages"][0][1]
+
+
+@pytest.mark.parametrize("sender_email, recipient_email, subject, body, subtype, cc", [
+    ("me@x", "a@x", "Hi", "body", "plain", None),
+    ("me@x", "a@x", "Hi", "<p>body</p>", "html", None),
+    ("Zoë <me@x>", "José <j@x.com>", "Grüße", "naïve body", "plain", None),
+    ("me@x", "a@x", "word " * 40, "body", "plain", None),
+    ("me@x", "a@x", "größer " * 20, "body", "plain", None),
+    ("me@x", "a@x", "Hi", "one\rtwo\rthree", "plain", None),
+    ("me@x", "a@x", "Hi", "one\ntwo\n", "plain", None),
+    ("me@x", "a@x", "Hi", "one\rtwo\nthree\r\n", "plain", None),
+    ("me@x", "a@x", "Hi", "ünï\ncode\r", "plain", None),
+    ("me@x", "a@x", "Hi", "", "plain", None),
+    ("me@x", "a@x", "Hi", "body", "plain", ["b@x", "Ça <c@x>"]),
+])
+def test_build_message_matches_mimetext(sender_email, recipient_email, subject, body, subtype, cc):
+    sender = GmailSender(sender_email, "pw")
+    message = sender.build_message(subject, body, subtype == "html", cc)
+    _, message = sender._address(message, recipient_email, cc)
+    assert message == _mimetext(sender_email, recipient_email, subject, body, subtype, cc)
+
+
+def _messages(count):
+    return [{"recipient_email": "a@x", "subject": f"msg {i}", "message_body": "body"}
+            for i in range(count)]
+
+
+def _subjects(state):
+    return [body.split(b"Subject: ")[1].split(b"\r\n")[0].decode() for _, body in state["messages"]]
+
+
+def test_pool_reconnects_and_keeps_order(smtp):
+    pool = GmailPool("me@x", "pw", concurrency=1, max_msgs_per_conn=2, retry_backoff=0)
+    assert pool.send_bulk(_messages(5)) == [True] * 5
+    assert _subjects(smtp) == [f"msg {i}" for i in range(5)]
+    assert sum(c.upper().startswith("EHLO") for c in smtp["commands"]) == 3
+
+
+def test_pool_hands_back_task_after_failed_reconnect(smtp):
+    # Both workers connect, then the first reconnect is refused
+    smtp["refuse_connections"] = {2}
+    pool = GmailPool("me@x", "pw", concurrency=2, max_msgs_per_conn=1, retry_backoff=0)
+    assert pool.send_bulk(_messages(6)) == [True] * 6
+    assert sorted(_subjects(smtp)) == [f"msg {i}" for i in range(6)]
+
+
+def test_pool_retries_transient_errors(smtp):
+    smtp["body_replies"] = ["450 mailbox busy"]
+    pool = GmailPool("me@x", "pw", concurrency=1, retry_backoff=0)
+    assert pool.send_bulk(_messages(1)) == [True]
+    assert len(smtp["messages"]) == 1
+    assert sum(c.upper().startswith("BDAT") for c in smtp["commands"]) == 2
+
+
+def test_pool_does_not_retry_permanent_errors(smtp):
+    smtp["body_replies"] = ["550 rejected"]
+    pool = GmailPool("me@x", "pw", concurrency=1, retry_backoff=0)
+    assert pool.send_bulk(_messages(1)) == [False]
+    assert smtp["messages"] == []
+    assert sum(c.upper().startswith("BDAT") for c in smtp["commands"]) == 1
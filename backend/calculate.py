@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 
-def sum_numbers(a, b):
-    """Add two numbers and return the result."""
-    return a + b
+from operator import add
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Add two numbers and return the result. Bound directly to the C
+# implementation of `+`, which skips a Python-level call frame per call.
+sum_numbers = add
 
 def multiply_numbers(a, b):
     """Multiply two numbers and return the result."""
@@ -14,6 +21,34 @@ def divide_numbers(a, b):
         raise ValueError("Cannot divide by zero")
     return a / b
 
+# Array versions of the functions above. They take arrays (or anything
+# np.asarray accepts) and loop in NumPy's compiled ufuncs; plain scalars
+# should keep using the functions above. Pass `out` to reuse an existing
+# array instead of allocating a new result.
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for array operations: pip install numpy")
+
+def sum_numbers_vec(a, b, out=None):
+    """Add two arrays elementwise and return the result."""
+    _require_numpy()
+    return np.add(np.asarray(a), np.asarray(b), out=out)
+
+def multiply_numbers_vec(a, b, out=None):
+    """Multiply two arrays elementwise and return the result."""
+    _require_numpy()
+    return np.multiply(np.asarray(a), np.asarray(b), out=out)
+
+def divide_numbers_vec(a, b, out=None):
+    """Divide two arrays elementwise and return the result."""
+    _require_numpy()
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if (b == 0).any():
+        raise ValueError("Cannot divide by zero")
+    return np.divide(a, b, out=out)
+
 # Example usage
 if __name__ == "__main__":
     # Test sum function
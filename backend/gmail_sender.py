@@ -5,15 +5,148 @@ A modular script for sending emails using Gmail's SMTP server with TLS encryptio
 Supports both plain text and HTML email formats.
 """
 
+import asyncio
+import base64
+import logging
 import smtplib
+import socket
+import ssl
 import os
+import queue
+import re
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
-from typing import Optional, List
+from email.header import Header
+from typing import Any, Dict, Iterable, Optional, List, Tuple
 import sys
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
+# Use pybase64's SIMD encoder when its C extension is active for this CPU
+# (it reports e.g. "1.4.0 (C extension active - AVX2)"); otherwise the
+# standard library, which produces the same output.
+if pybase64 is not None and 'C extension active' in pybase64.get_version():
+    _encodebytes = pybase64.encodebytes
+else:
+    _encodebytes = base64.encodebytes
+
+logger = logging.getLogger(__name__)
+
+# Built once at import and shared by every session: creating a context
+# loads the system CA bundle, and TLS sessions can only be resumed
+# through the context that created them
+_SSL_CTX = ssl.create_default_context()
+
+
+def _local_hostname() -> str:
+    """
+    Compute the EHLO name the way smtplib.SMTP does: the FQDN if it has a
+    dot, otherwise an address literal as RFC 5321 requires.
+    """
+    fqdn = socket.getfqdn()
+    if '.' in fqdn:
+        return fqdn
+    
+    addr = '127.0.0.1'
+    try:
+        addr = socket.gethostbyname(socket.gethostname())
+    except socket.gaierror:
+        pass
+    return f'[{addr}]'
+
+
+# Name sent in EHLO; smtplib would otherwise look it up on every connection
+_LOCAL_HOSTNAME = _local_hostname()
+
+# Line endings the email package normalizes to CRLF in message bodies
+_NEWLINES = re.compile(rb'\r\n|\r|\n')
+
+# Exception types from whichever SMTP clients are available
+if aiosmtplib is not None:
+    _AUTH_ERRORS = (smtplib.SMTPAuthenticationError, aiosmtplib.SMTPAuthenticationError)
+    _SMTP_ERRORS = (smtplib.SMTPException, aiosmtplib.SMTPException)
+else:
+    _AUTH_ERRORS = (smtplib.SMTPAuthenticationError,)
+    _SMTP_ERRORS = (smtplib.SMTPException,)
+
+
+def _encode_header(name: str, value: str) -> bytes:
+    """
+    Encode a header value the way the email package's default policy does,
+    RFC 2047-encoding non-ASCII text and folding at 78 characters.
+    """
+    folded = Header(value, header_name=name).encode(linesep='\r\n', maxlinelen=78)
+    return folded.encode('ascii')
+
+
+def _fold_header(name: str, value: str) -> bytes:
+    """
+    Render one complete header line with _encode_header().
+    """
+    return name.encode('ascii') + b': ' + _encode_header(name, value) + b'\r\n'
+
+
+class _LowLatencySMTP(smtplib.SMTP):
+    """
+    smtplib.SMTP with Nagle's algorithm disabled on its socket.
+    
+    Small command writes that go out before the previous reply has been
+    read are sent immediately instead of waiting on delayed ACKs. The
+    address each host resolved to is remembered, so reconnects skip the
+    DNS lookup.
+    """
+    
+    # Last address that accepted a connection, keyed by (host, port)
+    _resolved_addresses: Dict[Tuple[str, int], str] = {}
+    
+    def _get_socket(self, host, port, timeout):
+        sock = None
+        address = self._resolved_addresses.get((host, port))
+        if address is not None:
+            try:
+                sock = socket.create_connection(
+                    (address, port), timeout, self.source_address
+                )
+            except OSError:
+                # The cached address went stale; resolve the host again
+                self._resolved_addresses.pop((host, port), None)
+        
+        if sock is None:
+            sock = super()._get_socket(host, port, timeout)
+            self._resolved_addresses[(host, port)] = sock.getpeername()[0]
+        
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+
+class _ResumingContext:
+    """
+    Wraps an SSLContext so smtplib's starttls() resumes a previous TLS session.
+    
+    starttls() only calls context.wrap_socket(sock, server_hostname=...),
+    which has no way to pass a session through.
+    """
+    
+    def __init__(self, context: ssl.SSLContext, session: Optional[ssl.SSLSession]):
+        self._context = context
+        self._session = session
+    
+    def wrap_socket(self, sock: socket.socket, server_hostname: Optional[str] = None) -> ssl.SSLSocket:
+        return self._context.wrap_socket(
+            sock, server_hostname=server_hostname, session=self._session
+        )
+
 
 class GmailSender:
     """
@@ -24,6 +157,16 @@ class GmailSender:
     SMTP_SERVER = "smtp.gmail.com"
     SMTP_PORT = 587
     
+    # Transport used for synchronous sessions; any smtplib.SMTP subclass works
+    SMTP_CLASS = _LowLatencySMTP
+    
+    # Attachments are read and base64-encoded in blocks of this size; a
+    # multiple of 57 bytes so each block encodes to whole 76-character lines
+    ATTACHMENT_CHUNK_SIZE = 57 * 1024
+    
+    # Stands in for the recipient in the To: header of prepared messages
+    TO_PLACEHOLDER = b'%%TO%%'
+    
     def __init__(self, sender_email: str, password: str):
         """
         Initialize the Gmail sender with credentials.
@@ -34,6 +177,79 @@ class GmailSender:
         """
         self.sender_email = sender_email
         self.password = password
+        self._server: Optional[smtplib.SMTP] = None
+        self._tls_session: Optional[ssl.SSLSession] = None
+        
+        # From: and To: headers shared by every single-part message; the
+        # To: placeholder is filled in per recipient by send_prepared()
+        self._header_template = (
+            _fold_header('From', sender_email)
+            + b'To: ' + self.TO_PLACEHOLDER + b'\r\n'
+        )
+    
+    def __enter__(self) -> "GmailSender":
+        self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def connect(self) -> None:
+        """
+        Open an authenticated SMTP session that is reused by later sends.
+        
+        Does nothing if a session is already open.
+        """
+        if self._server is not None:
+            return
+        
+        # Connect to Gmail SMTP server
+        logger.debug("Connecting to %s:%s...", self.SMTP_SERVER, self.SMTP_PORT)
+        server = self.SMTP_CLASS(
+            self.SMTP_SERVER, self.SMTP_PORT, local_hostname=_LOCAL_HOSTNAME
+        )
+        
+        try:
+            # Start TLS encryption
+            logger.debug("Starting TLS encryption...")
+            server.starttls(context=_ResumingContext(_SSL_CTX, self._tls_session))
+            
+            # Login to Gmail account
+            logger.debug("Logging in...")
+            server.login(self.sender_email, self.password)
+        except Exception:
+            server.close()
+            raise
+        
+        self._server = server
+    
+    def close(self) -> None:
+        """
+        Close the SMTP session if one is open.
+        """
+        if self._server is None:
+            return
+        
+        server, self._server = self._server, None
+        
+        # Keep the TLS session so the next connect() can resume it
+        # instead of doing a full handshake
+        session = getattr(server.sock, 'session', None)
+        if session is not None:
+            self._tls_session = session
+        
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            # The server already dropped the connection
+            server.close()
+    
+    def reconnect(self) -> None:
+        """
+        Replace the current SMTP session with a fresh one.
+        """
+        self.close()
+        self.connect()
     
     def send_email(
         self,
@@ -61,66 +277,570 @@ class GmailSender:
             bool: True if email sent successfully, False otherwise
         """
         try:
-            # Create message container
-            message = MIMEMultipart()
-            message['From'] = self.sender_email
-            message['To'] = recipient_email
-            message['Subject'] = subject
-            
-            # Add CC recipients if provided
-            if cc:
-                message['Cc'] = ', '.join(cc)
-            
-            # Determine message type (plain text or HTML)
-            msg_type = 'html' if is_html else 'plain'
-            message.attach(MIMEText(message_body, msg_type))
-            
-            # Add attachments if provided
-            if attachments:
-                for file_path in attachments:
-                    self._attach_file(message, file_path)
-            
-            # Prepare recipient list (To + CC + BCC)
-            recipients = [recipient_email]
-            if cc:
-                recipients.extend(cc)
-            if bcc:
-                recipients.extend(bcc)
-            
-            # Connect to Gmail SMTP server
-            print(f"Connecting to {self.SMTP_SERVER}:{self.SMTP_PORT}...")
-            server = smtplib.SMTP(self.SMTP_SERVER, self.SMTP_PORT)
-            
-            # Start TLS encryption
-            print("Starting TLS encryption...")
-            server.starttls()
-            
-            # Login to Gmail account
-            print("Logging in...")
-            server.login(self.sender_email, self.password)
+            self._send(
+                recipient_email, subject, message_body,
+                is_html, cc, bcc, attachments
+            )
             
-            # Send email
-            print("Sending email...")
-            server.sendmail(self.sender_email, recipients, message.as_string())
+            logger.info("✓ Email sent successfully to %s", recipient_email)
+            return True
             
-            # Close connection
-            server.quit()
+        except Exception as e:
+            self._report_error(e)
+            return False
+    
+    def build_message(
+        self,
+        subject: str,
+        message_body: str,
+        is_html: bool = False,
+        cc: Optional[List[str]] = None,
+        attachments: Optional[List[str]] = None
+    ) -> bytes:
+        """
+        Render an email once so it can be sent to many recipients.
+        
+        The To: header holds TO_PLACEHOLDER, which send_prepared() swaps for
+        the actual recipient, so the body and attachments are encoded once.
+        
+        Args:
+            subject: Email subject line
+            message_body: The content of the email
+            is_html: If True, send as HTML email; otherwise plain text
+            cc: List of CC email addresses for the Cc: header (optional)
+            attachments: List of file paths to attach (optional)
+        
+        Returns:
+            bytes: The rendered message with CRLF line endings
+        """
+        # Determine message type (plain text or HTML)
+        msg_type = 'html' if is_html else 'plain'
+        
+        # Without attachments a single text part is enough, and it can be
+        # rendered from the precompiled header template
+        if not attachments:
+            return self._build_text_message(subject, message_body, msg_type, cc)
+        
+        message = MIMEMultipart()
+        message.attach(MIMEText(message_body, msg_type))
+        for file_path in attachments:
+            self._attach_file(message, file_path)
+        
+        message['From'] = self.sender_email
+        message['To'] = self.TO_PLACEHOLDER.decode('ascii')
+        message['Subject'] = subject
+        
+        # Add CC recipients if provided
+        if cc:
+            message['Cc'] = ', '.join(cc)
+        
+        # Render with SMTP line endings so smtplib sends the bytes as-is
+        return message.as_bytes(policy=message.policy.clone(linesep='\r\n'))
+    
+    def _build_text_message(
+        self,
+        subject: str,
+        message_body: str,
+        msg_type: str,
+        cc: Optional[List[str]] = None
+    ) -> bytes:
+        """
+        Render a single-part text email straight to bytes.
+        
+        Produces the same bytes as rendering a MIMEText with the email
+        package (us-ascii/7bit when possible, otherwise utf-8/base64), but
+        skips building and flattening a Message object.
+        """
+        try:
+            body = _NEWLINES.sub(b'\r\n', message_body.encode('ascii'))
+            charset, encoding = 'us-ascii', '7bit'
+        except UnicodeEncodeError:
+            body = _encodebytes(message_body.encode('utf-8')).replace(b'\n', b'\r\n')
+            charset, encoding = 'utf-8', 'base64'
+        
+        headers = [
+            f'Content-Type: text/{msg_type}; charset="{charset}"\r\n'
+            f'MIME-Version: 1.0\r\n'
+            f'Content-Transfer-Encoding: {encoding}\r\n'.encode('ascii'),
+            self._header_template,
+            _fold_header('Subject', subject),
+        ]
+        if cc:
+            headers.append(_fold_header('Cc', ', '.join(cc)))
+        headers.append(b'\r\n')
+        headers.append(body)
+        return b''.join(headers)
+    
+    def send_prepared(
+        self,
+        message: bytes,
+        recipient_email: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Send a message rendered by build_message() to one recipient.
+        
+        Args:
+            message: The output of build_message()
+            recipient_email: Email address of the recipient
+            cc: CC addresses to deliver to, as passed to build_message() (optional)
+            bcc: List of BCC email addresses (optional)
+        
+        Returns:
+            bool: True if email sent successfully, False otherwise
+        """
+        try:
+            self._send_prepared(message, recipient_email, cc, bcc)
             
-            print(f"✓ Email sent successfully to {recipient_email}")
+            logger.info("✓ Email sent successfully to %s", recipient_email)
             return True
             
-        except smtplib.SMTPAuthenticationError:
-            print("✗ Authentication failed. Please check your email and App Password.")
-            print("  Make sure you're using an App Password, not your regular Gmail password.")
+        except Exception as e:
+            self._report_error(e)
             return False
+    
+    def _report_error(self, error: Exception) -> None:
+        """
+        Log a user-facing explanation of a failed send.
+        """
+        if isinstance(error, _AUTH_ERRORS):
+            logger.error(
+                "✗ Authentication failed. Please check your email and App Password.\n"
+                "  Make sure you're using an App Password, not your regular Gmail password."
+            )
+        elif isinstance(error, _SMTP_ERRORS):
+            logger.error("✗ SMTP error occurred: %s", error)
+        else:
+            logger.error("✗ An error occurred: %s", error)
+    
+    def _send(
+        self,
+        recipient_email: str,
+        subject: str,
+        message_body: str,
+        is_html: bool = False,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        attachments: Optional[List[str]] = None
+    ) -> None:
+        """
+        Build and deliver an email, raising on failure.
+        
+        Takes the same arguments as send_email().
+        """
+        message = self.build_message(subject, message_body, is_html, cc, attachments)
+        self._send_prepared(message, recipient_email, cc, bcc)
+    
+    def _send_prepared(
+        self,
+        message: bytes,
+        recipient_email: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> None:
+        """
+        Address and deliver a message from build_message(), raising on failure.
+        """
+        self._deliver(*self._address(message, recipient_email, cc, bcc))
+    
+    def _address(
+        self,
+        message: bytes,
+        recipient_email: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> Tuple[List[str], bytes]:
+        """
+        Fill in the To: header of a prepared message and list its recipients.
+        
+        Returns:
+            Tuple[List[str], bytes]: Envelope recipients and the addressed message
+        """
+        # A line break in the address would let it inject headers of its own
+        if '\r' in recipient_email or '\n' in recipient_email:
+            raise ValueError(f"Recipient address contains a line break: {recipient_email!r}")
+        
+        # Only the first occurrence is the To: header; the body is left alone
+        message = message.replace(
+            self.TO_PLACEHOLDER, _encode_header('To', recipient_email), 1
+        )
+        
+        # Prepare recipient list (To + CC + BCC)
+        recipients = [recipient_email]
+        if cc:
+            recipients.extend(cc)
+        if bcc:
+            recipients.extend(bcc)
+        
+        return recipients, message
+    
+    def send_bulk(self, messages: Iterable[Dict[str, Any]]) -> List[bool]:
+        """
+        Send several emails over a single SMTP session.
+        
+        An already open session is probed with NOOP and reopened if the
+        server dropped it; otherwise a session is opened for the duration
+        of the call.
+        
+        Args:
+            messages: Keyword arguments for send_email(), one dict per email
+        
+        Returns:
+            List[bool]: The send_email() result for each message, in order
+        """
+        opened_here = self._server is None
+        try:
+            self._ensure_connection()
+        except smtplib.SMTPAuthenticationError as e:
+            self._report_error(e)
+            return [False for _ in messages]
+        except (smtplib.SMTPException, OSError) as e:
+            logger.error("✗ Could not connect to %s: %s", self.SMTP_SERVER, e)
+            return [False for _ in messages]
+        
+        try:
+            return [self.send_email(**kwargs) for kwargs in messages]
+        finally:
+            if opened_here:
+                self.close()
+    
+    def _ensure_connection(self) -> None:
+        """
+        Make sure an open, responsive SMTP session is available.
+        """
+        if self._server is None:
+            self.connect()
+            return
+        
+        try:
+            code, _ = self._server.noop()
+        except smtplib.SMTPServerDisconnected:
+            code = None
+        
+        if code != 250:
+            self.reconnect()
+    
+    def _deliver(self, recipients: List[str], message: bytes) -> Dict[str, Tuple[int, bytes]]:
+        """
+        Hand a rendered message to the SMTP server.
+        
+        Reuses the open session if there is one, reconnecting once if the
+        server dropped it before the message body was sent. Without an open
+        session, a session is opened for this message only.
+        
+        Args:
+            recipients: Envelope recipients (To + CC + BCC)
+            message: The rendered message
+        
+        Returns:
+            Dict[str, Tuple[int, bytes]]: Refused recipients and the server's reply
+        """
+        if self._server is None:
+            self.connect()
+            try:
+                logger.debug("Sending email...")
+                refused = self._send_envelope(recipients, message)
+                self._send_body(message)
+                return refused
+            finally:
+                self.close()
+        
+        logger.debug("Sending email...")
+        try:
+            refused = self._send_envelope(recipients, message)
+        except smtplib.SMTPServerDisconnected:
+            # Nothing has been delivered yet, so starting over is safe
+            logger.warning("Connection lost, reconnecting...")
+            self.reconnect()
+            refused = self._send_envelope(recipients, message)
+        
+        # Not retried: once the body is out, the server may already have
+        # accepted the message even if its reply never arrives
+        self._send_body(message)
+        return refused
+    
+    def _send_envelope(self, recipients: List[str], message: bytes) -> Dict[str, Tuple[int, bytes]]:
+        """
+        Start an SMTP transaction with MAIL FROM and one RCPT TO per recipient.
+        
+        Behaves like the envelope half of smtplib.SMTP.sendmail(), but when
+        the server supports PIPELINING, MAIL FROM and every RCPT TO are
+        written at once and their replies read afterwards, so the envelope
+        costs one round trip rather than one per command. The message size is
+        declared when the server advertises SIZE.
+        
+        Returns:
+            Dict[str, Tuple[int, bytes]]: Refused recipients and the server's reply
+        
+        Raises:
+            ValueError: If an address contains a CR or LF character
+        """
+        server = self._server
+        
+        # Declare the size up front, as sendmail() does, so the server can
+        # refuse an oversized message before the body is sent
+        options = []
+        if server.does_esmtp and server.has_extn('size'):
+            options.append(f"size={len(message)}")
+        
+        if server.has_extn('pipelining'):
+            optionlist = ''.join(f" {option}" for option in options)
+            commands = [f"MAIL FROM:{smtplib.quoteaddr(self.sender_email)}{optionlist}"]
+            commands.extend(f"RCPT TO:{smtplib.quoteaddr(r)}" for r in recipients)
             
-        except smtplib.SMTPException as e:
-            print(f"✗ SMTP error occurred: {str(e)}")
-            return False
+            # The same check putcmd() applies: a line break in an address
+            # would smuggle in extra SMTP commands
+            for command in commands:
+                if '\r' in command or '\n' in command:
+                    command = command.replace('\n', '\\n').replace('\r', '\\r')
+                    raise ValueError(
+                        f"command and arguments contain prohibited newline characters: {command}"
+                    )
+            server.send(''.join(f"{command}\r\n" for command in commands))
             
+            code, resp = server.getreply()
+            replies = [server.getreply() for _ in recipients]
+        else:
+            code, resp = server.mail(self.sender_email, options)
+            replies = [server.rcpt(r) for r in recipients] if code == 250 else []
+        
+        if code != 250:
+            self._abort_transaction(code)
+            raise smtplib.SMTPSenderRefused(code, resp, self.sender_email)
+        
+        refused = {
+            recipient: reply
+            for recipient, reply in zip(recipients, replies)
+            if reply[0] not in (250, 251)
+        }
+        if len(refused) == len(recipients):
+            self._abort_transaction(code)
+            raise smtplib.SMTPRecipientsRefused(refused)
+        
+        return refused
+    
+    def _send_body(self, message: bytes) -> None:
+        """
+        Send the message body to complete the transaction (DATA or BDAT).
+        
+        With CHUNKING the message goes out as a single BDAT chunk instead
+        of DATA.
+        """
+        server = self._server
+        if server.has_extn('chunking'):
+            # BDAT (RFC 3030) sends the message bytes as-is, skipping the
+            # dot-stuffing copy data() makes of the whole message
+            server.putcmd('BDAT', f"{len(message)} LAST")
+            server.send(message)
+            code, resp = server.getreply()
+        else:
+            code, resp = server.data(message)
+        if code != 250:
+            self._abort_transaction(code)
+            raise smtplib.SMTPDataError(code, resp)
+    
+    def _abort_transaction(self, code: int) -> None:
+        """
+        Reset the open session after a failed transaction, as sendmail() does.
+        """
+        if code == 421:
+            # The server is closing the connection; the next send on this
+            # session sees it as disconnected and reconnects
+            self._server.close()
+        else:
+            try:
+                self._server.rset()
+            except smtplib.SMTPServerDisconnected:
+                pass
+    
+    def send_to_many(self, recipients: List[str], message: bytes) -> bool:
+        """
+        Send one message to many recipients in a single SMTP transaction.
+        
+        Suited to newsletters where everyone gets identical bytes. Recipients
+        are not listed in the headers; a To: placeholder from build_message()
+        becomes "undisclosed-recipients:;".
+        
+        Args:
+            recipients: Envelope recipients
+            message: A message from build_message()
+        
+        Returns:
+            bool: True if at least one recipient was accepted, False otherwise
+        """
+        recipients = list(recipients)
+        message = message.replace(self.TO_PLACEHOLDER, b'undisclosed-recipients:;', 1)
+        try:
+            refused = self._deliver(recipients, message)
+        except Exception as e:
+            self._report_error(e)
+            return False
+        
+        for recipient, (code, resp) in refused.items():
+            logger.warning("  %s was refused: %s %s", recipient, code, resp)
+        logger.info(
+            "✓ Email sent successfully to %d recipients",
+            len(recipients) - len(refused)
+        )
+        return True
+    
+    async def send_email_async(
+        self,
+        recipient_email: str,
+        subject: str,
+        message_body: str,
+        is_html: bool = False,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        attachments: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Send an email without blocking the event loop. Requires aiosmtplib.
+        
+        Takes the same arguments as send_email().
+        
+        Returns:
+            bool: True if email sent successfully, False otherwise
+        """
+        results = await self.send_bulk_async([{
+            'recipient_email': recipient_email,
+            'subject': subject,
+            'message_body': message_body,
+            'is_html': is_html,
+            'cc': cc,
+            'bcc': bcc,
+            'attachments': attachments,
+        }], concurrency=1)
+        return results[0]
+    
+    async def send_bulk_async(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        concurrency: int = 5
+    ) -> List[bool]:
+        """
+        Send emails concurrently from a single thread. Requires aiosmtplib.
+        
+        Opens up to `concurrency` SMTP sessions; each message borrows an idle
+        session, so at most that many sends are in flight at once.
+        
+        Args:
+            messages: Keyword arguments for send_email(), one dict per email
+            concurrency: Maximum number of simultaneous SMTP sessions (at least 1)
+        
+        Returns:
+            List[bool]: True for each message sent successfully, in order
+        """
+        if aiosmtplib is None:
+            raise ImportError(
+                "aiosmtplib is required for async sending: pip install aiosmtplib"
+            )
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        
+        messages = list(messages)
+        if not messages:
+            return []
+        
+        # Open the sessions side by side rather than paying for each
+        # handshake in turn, and carry on with whichever succeeded
+        results = await asyncio.gather(
+            *(self._connect_async() for _ in range(min(concurrency, len(messages)))),
+            return_exceptions=True
+        )
+        opened = []
+        for result in results:
+            if isinstance(result, BaseException):
+                self._report_error(result)
+            else:
+                opened.append(result)
+        if not opened:
+            return [False] * len(messages)
+        
+        clients: "asyncio.Queue[aiosmtplib.SMTP]" = asyncio.Queue()
+        for client in opened:
+            clients.put_nowait(client)
+        
+        try:
+            return list(await asyncio.gather(
+                *[self._send_one_async(clients, kwargs) for kwargs in messages]
+            ))
+        finally:
+            # Sessions replaced after a disconnect are only in the queue
+            while not clients.empty():
+                client = clients.get_nowait()
+                try:
+                    await client.quit()
+                except (aiosmtplib.SMTPException, OSError):
+                    client.close()
+    
+    async def _connect_async(self) -> "aiosmtplib.SMTP":
+        """
+        Open an authenticated aiosmtplib session.
+        """
+        logger.debug("Connecting to %s:%s...", self.SMTP_SERVER, self.SMTP_PORT)
+        client = aiosmtplib.SMTP(
+            hostname=self.SMTP_SERVER,
+            port=self.SMTP_PORT,
+            local_hostname=_LOCAL_HOSTNAME,
+            use_tls=False,
+            start_tls=True,
+            tls_context=_SSL_CTX
+        )
+        await client.connect()
+        try:
+            logger.debug("Logging in...")
+            await client.login(self.sender_email, self.password)
+        except Exception:
+            client.close()
+            raise
+        return client
+    
+    async def _send_one_async(
+        self,
+        clients: "asyncio.Queue[aiosmtplib.SMTP]",
+        kwargs: Dict[str, Any]
+    ) -> bool:
+        """
+        Send one message over the next idle session from `clients`.
+        
+        A session the server has dropped is replaced before the session
+        goes back into `clients`.
+        """
+        recipient_email = kwargs['recipient_email']
+        try:
+            message = self.build_message(
+                kwargs['subject'],
+                kwargs['message_body'],
+                kwargs.get('is_html', False),
+                kwargs.get('cc'),
+                kwargs.get('attachments')
+            )
+            recipients, message = self._address(
+                message, recipient_email, kwargs.get('cc'), kwargs.get('bcc')
+            )
         except Exception as e:
-            print(f"✗ An error occurred: {str(e)}")
+            self._report_error(e)
             return False
+        
+        client = await clients.get()
+        try:
+            try:
+                await client.sendmail(self.sender_email, recipients, message)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Replace the dropped session so later messages don't fail on
+                # it too, and give this message one more try
+                client.close()
+                client = await self._connect_async()
+                await client.sendmail(self.sender_email, recipients, message)
+            logger.info("✓ Email sent successfully to %s", recipient_email)
+            return True
+        except Exception as e:
+            self._report_error(e)
+            return False
+        finally:
+            clients.put_nowait(client)
     
     def _attach_file(self, message: MIMEMultipart, file_path: str) -> None:
         """
@@ -131,22 +851,188 @@ class GmailSender:
             file_path: Path to the file to attach
         """
         try:
+            # Encode while reading so the raw file contents are never
+            # held in memory alongside the base64 text
             with open(file_path, 'rb') as file:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(file.read())
+                # Allocate the exact encoded size up front: 4 characters per
+                # 3 input bytes plus one newline per 57-byte line
+                size = os.fstat(file.fileno()).st_size
+                encoded = bytearray(4 * ((size + 2) // 3) + (size + 56) // 57)
+                end = 0
+                for chunk in iter(lambda: file.read(self.ATTACHMENT_CHUNK_SIZE), b''):
+                    block = _encodebytes(chunk)
+                    encoded[end:end + len(block)] = block
+                    end += len(block)
             
-            encoders.encode_base64(part)
+            # Trim in case the file shrank while it was being read
+            del encoded[end:]
+            
+            part = MIMEBase('application', 'octet-stream')
+            part['Content-Transfer-Encoding'] = 'base64'
+            part.set_payload(encoded.decode('ascii'))
+            del encoded
             part.add_header(
                 'Content-Disposition',
                 f'attachment; filename= {os.path.basename(file_path)}'
             )
             message.attach(part)
-            print(f"  Attached: {os.path.basename(file_path)}")
+            logger.debug("  Attached: %s", os.path.basename(file_path))
             
         except FileNotFoundError:
-            print(f"  Warning: File not found: {file_path}")
+            logger.warning("  File not found: %s", file_path)
         except Exception as e:
-            print(f"  Warning: Could not attach {file_path}: {str(e)}")
+            logger.warning("  Could not attach %s: %s", file_path, e)
+
+
+class GmailPool:
+    """
+    Send many emails concurrently over a bounded set of persistent SMTP sessions.
+    
+    Each worker thread owns one GmailSender with its own connection and pulls
+    messages from a shared queue.
+    """
+    
+    # Gmail allows at most 15 simultaneous SMTP connections per account
+    MAX_CONNECTIONS = 15
+    
+    # SMTP reply codes worth retrying (service unavailable, mailbox busy,
+    # temporary auth failure, transaction failed)
+    TRANSIENT_SMTP_CODES = frozenset({421, 450, 454, 554})
+    
+    def __init__(
+        self,
+        sender_email: str,
+        password: str,
+        concurrency: int = 5,
+        max_msgs_per_conn: int = 100,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0
+    ):
+        """
+        Initialize the pool with credentials and limits.
+        
+        Args:
+            sender_email: The Gmail address to send from
+            password: The Gmail App Password (not regular password)
+            concurrency: Number of worker threads / SMTP connections
+            max_msgs_per_conn: Messages sent before a worker reconnects
+            max_retries: Retries per message on transient SMTP errors
+            retry_backoff: Initial delay in seconds, doubled after each retry
+        """
+        if not 1 <= concurrency <= self.MAX_CONNECTIONS:
+            raise ValueError(
+                f"concurrency must be between 1 and {self.MAX_CONNECTIONS}"
+            )
+        if max_msgs_per_conn < 1:
+            raise ValueError("max_msgs_per_conn must be at least 1")
+        
+        self.sender_email = sender_email
+        self.password = password
+        self.concurrency = concurrency
+        self.max_msgs_per_conn = max_msgs_per_conn
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+    
+    def send_bulk(self, messages: Iterable[Dict[str, Any]]) -> List[bool]:
+        """
+        Send emails concurrently.
+        
+        Args:
+            messages: Keyword arguments for GmailSender.send_email(), one dict per email
+        
+        Returns:
+            List[bool]: True for each message sent successfully, in order
+        """
+        # Every task is queued before the workers start, so a worker that
+        # finds the queue empty knows all remaining work is taken
+        tasks: "queue.Queue[Tuple[int, Dict[str, Any]]]" = queue.Queue()
+        count = 0
+        for index, kwargs in enumerate(messages):
+            tasks.put((index, kwargs))
+            count += 1
+        
+        results = [False] * count
+        workers = [
+            threading.Thread(target=self._worker, args=(tasks, results), daemon=True)
+            for _ in range(min(self.concurrency, count))
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        return results
+    
+    def _worker(
+        self,
+        tasks: "queue.Queue[Tuple[int, Dict[str, Any]]]",
+        results: List[bool]
+    ) -> None:
+        """
+        Pull messages from the queue and send them over one persistent session.
+        """
+        sender = GmailSender(self.sender_email, self.password)
+        try:
+            sender.connect()
+        except smtplib.SMTPAuthenticationError as e:
+            sender._report_error(e)
+            return
+        except (smtplib.SMTPException, OSError) as e:
+            # Leave the remaining tasks to the other workers
+            logger.error("✗ Worker could not connect to %s: %s", sender.SMTP_SERVER, e)
+            return
+        
+        sent_on_conn = 0
+        try:
+            while True:
+                try:
+                    task = tasks.get_nowait()
+                except queue.Empty:
+                    break
+                
+                index, kwargs = task
+                if sent_on_conn >= self.max_msgs_per_conn:
+                    try:
+                        sender.reconnect()
+                    except (smtplib.SMTPException, OSError) as e:
+                        # Hand the task back to the workers still running
+                        logger.error("✗ Worker could not reconnect: %s", e)
+                        tasks.put(task)
+                        break
+                    sent_on_conn = 0
+                
+                results[index] = self._send_with_retry(sender, kwargs)
+                sent_on_conn += 1
+        finally:
+            sender.close()
+    
+    def _send_with_retry(self, sender: GmailSender, kwargs: Dict[str, Any]) -> bool:
+        """
+        Send one message, retrying transient SMTP errors with exponential backoff.
+        """
+        recipient_email = kwargs.get('recipient_email')
+        for attempt in range(self.max_retries + 1):
+            try:
+                if attempt:
+                    sender._ensure_connection()
+                sender._send(**kwargs)
+                logger.info("✓ Email sent successfully to %s", recipient_email)
+                return True
+            
+            except smtplib.SMTPResponseException as e:
+                if (e.smtp_code not in self.TRANSIENT_SMTP_CODES
+                        or attempt == self.max_retries):
+                    sender._report_error(e)
+                    return False
+                delay = self.retry_backoff * 2 ** attempt
+                logger.warning("  Temporary SMTP error %s, retrying in %gs...", e.smtp_code, delay)
+                time.sleep(delay)
+            
+            except Exception as e:
+                sender._report_error(e)
+                return False
+        
+        return False
 
 
 def send_simple_email(
@@ -155,7 +1041,8 @@ def send_simple_email(
     recipient_email: str,
     subject: str,
     message_body: str,
-    is_html: bool = False
+    is_html: bool = False,
+    sender: Optional[GmailSender] = None
 ) -> bool:
     """
     Convenience function to send a simple email without creating a GmailSender instance.
@@ -167,11 +1054,14 @@ def send_simple_email(
         subject: Email subject line
         message_body: The content of the email
         is_html: If True, send as HTML email; otherwise plain text
+        sender: An existing (possibly connected) GmailSender to reuse;
+            sender_email and password are ignored when given
 
     Returns:
         bool: True if email sent successfully, False otherwise
     """
-    sender = GmailSender(sender_email, password)
+    if sender is None:
+        sender = GmailSender(sender_email, password)
     return sender.send_email(recipient_email, subject, message_body, is_html)
 
 
@@ -180,6 +1070,9 @@ def main():
     Example usage of the GmailSender class.
     Demonstrates how to use environment variables for credentials.
     """
+    # Show send results; use level=logging.DEBUG to also see connection steps
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     # Get credentials from environment variables
     sender_email = os.getenv('GMAIL_SENDER')
     password = os.getenv('GMAIL_APP_PASSWORD')
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True)
+    def _fma_kernel(a, b, c, out):
+        for i in prange(a.shape[0]):
+            out[i] = a[i] * b[i] + c[i]
+
+def fma(a, b, c, out=None):
+    """Compute a * b + c elementwise in one pass and return the result."""
+    a = np.asarray(a)
+    b = np.asarray(b)
+    c = np.asarray(c)
+    if a.ndim != 1 or a.shape != b.shape or a.shape != c.shape:
+        raise ValueError("fma expects three 1-D arrays of the same length")
+    if out is None:
+        out = np.empty(a.shape, dtype=np.result_type(a, b, c))
+    elif out.shape != a.shape:
+        # The Numba kernel has no bounds checking, so a short `out` would
+        # be written past its end
+        raise ValueError("fma expects `out` to have the same length as the inputs")
+
+    if njit is not None:
+        # Fused loop: no intermediate a * b array is materialized
+        _fma_kernel(a, b, c, out)
+    else:
+        # Without Numba, fall back to two in-place ufunc passes
+        np.multiply(a, b, out=out)
+        np.add(out, c, out=out)
+    return out
+
+# Example usage
+if __name__ == "__main__":
+    a = np.arange(4.0)
+    b = np.full(4, 2.0)
+    c = np.ones(4)
+    print(f"{a} × {b} + {c} = {fma(a, b, c)}")